@@ -6,7 +6,10 @@ to interact with a public REST API (JSONPlaceholder).
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 from wexample_api.common.abstract_gateway import AbstractGateway
+from wexample_api.common.endpoint import endpoint
 from wexample_api.enums.http import HttpMethod
 from wexample_helpers.decorator.base_class import base_class
 from wexample_prompt.common.io_manager import IoManager
@@ -20,61 +23,55 @@ class HttpRequestExample(InteractiveExample):
     def execute(self) -> None:
         @base_class
         class JsonPlaceholderGateway(AbstractGateway):
-            """Simple gateway to interact with JSONPlaceholder API."""
-
-            def get_post(self, post_id: int) -> dict | None:
-                """Fetch a single post by ID."""
-                response = self.make_request(
-                    endpoint=f"/posts/{post_id}",
-                    method=HttpMethod.GET,
-                    expected_status_codes=200,
-                    call_origin=__file__,
-                )
-                return response.json() if response else None
+            """Simple gateway to interact with JSONPlaceholder API.
 
-            def create_post(self, title: str, body: str, user_id: int = 1) -> dict | None:
-                """Create a new post."""
-                response = self.make_request(
-                    endpoint="/posts",
-                    method=HttpMethod.POST,
-                    data={"title": title, "body": body, "userId": user_id},
-                    expected_status_codes=201,
-                    call_origin=__file__,
-                )
-                return response.json() if response else None
+            Each endpoint is declared once; the constants (path template,
+            method, expected status codes) are evaluated at class build
+            time instead of on every call.
+            """
 
-            def list_posts(self, limit: int = 5) -> list[dict] | None:
-                """List posts with optional limit."""
-                response = self.make_request(
-                    endpoint="/posts",
-                    method=HttpMethod.GET,
-                    query_params={"_limit": limit},
-                    expected_status_codes=200,
-                    call_origin=__file__,
-                )
-                return response.json() if response else None
+            create_post = endpoint(
+                HttpMethod.POST, "/posts", 201, call_origin=__file__
+            )
+            get_post = endpoint(
+                HttpMethod.GET, "/posts/{post_id}", call_origin=__file__
+            )
+            list_posts = endpoint(HttpMethod.GET, "/posts", call_origin=__file__)
 
         # Initialize the gateway with JSONPlaceholder API
         io_manager = IoManager()
         gateway = JsonPlaceholderGateway(
             base_url="https://jsonplaceholder.typicode.com",
             io=io_manager,
+            # Allow the concurrent fetches below to burst through the rate
+            # limiter instead of queueing one second apart.
+            rate_limit_burst=4,
         )
 
         io_manager.title("HTTP Request Example with AbstractGateway")
 
-        # Example 1: Get a single post
-        io_manager.separator("1. Fetching a single post")
-        post = gateway.get_post(1)
-        if post:
-            io_manager.log(f"Post title: {post.get('title')}")
-            io_manager.log(f"Post body: {post.get('body')[:50]}...")
+        # Example 1: Fetch several posts concurrently. The shared session is
+        # thread-safe, so independent GETs can overlap instead of paying one
+        # round-trip each; map() yields the results in submission order.
+        io_manager.separator("1. Fetching posts concurrently")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            fetched = list(executor.map(gateway.get_post, [1, 2, 3, 4]))
+        for post in fetched:
+            if post:
+                io_manager.log(f"Post title: {post.get('title')}")
 
-        # Example 2: List multiple posts
+        # Example 2: Stream posts incrementally when the `stream` extra is
+        # installed — stream_json parses the body item by item, so
+        # iteration starts before the full response has arrived. On a
+        # plain install, fall back to loading the whole list at once.
         io_manager.separator("2. Listing posts")
-        posts = gateway.list_posts(limit=3)
-        if posts:
-            for i, p in enumerate(posts, 1):
+        try:
+            for i, p in enumerate(
+                gateway.stream_json("/posts", query_params={"_limit": 3}), 1
+            ):
+                io_manager.log(f"{i}. {p.get('title')}")
+        except ImportError:
+            for i, p in enumerate(gateway.list_posts(_limit=3) or [], 1):
                 io_manager.log(f"{i}. {p.get('title')}")
 
         # Example 3: Create a new post
@@ -1,26 +1,61 @@
 from __future__ import annotations
 
-import json
+import functools
+import threading
 import time
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.classes.mixin.has_snake_short_class_name_class_mixin import (
     HasSnakeShortClassNameClassMixin,
 )
 from wexample_helpers.classes.mixin.has_two_steps_init import HasTwoStepInit
 from wexample_helpers.decorator.base_class import base_class
+from wexample_helpers.error.gateway_error import GatewayError
 from wexample_prompt.mixin.with_io_manager import WithIoManager
 
-from wexample_api.enums.http import ContentType, HttpMethod
+from wexample_api.common.http_request_payload import HttpRequestPayload
+from wexample_api.enums.http import ContentType, Header, HttpMethod
 
 if TYPE_CHECKING:
+    from collections import OrderedDict
+
     from wexample_helpers.const.types import StringsList
 
-    from wexample_api.common.http_request_payload import HttpRequestPayload
-    from wexample_api.enums.http import Header
+    from wexample_api.common.http_response import HttpResponse
+    from wexample_api.common.response_cache import CachedResponse
+    from wexample_api.common.token_bucket import TokenBucket
+
+# Connection pool sizing for the shared HTTP session. One pool per host,
+# each keeping up to this many connections alive between requests.
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 10
+
+# Async backend limits: cap in-flight requests per host and keep idle
+# connections around long enough to be reused by subsequent fan-outs.
+_ASYNC_LIMIT_PER_HOST = 64
+_ASYNC_KEEPALIVE_TIMEOUT = 30
+
+# httpx client limits for the optional HTTP/2 path.
+_HTTP2_MAX_CONNECTIONS = 100
+_HTTP2_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# Sentinel distinguishing "not computed yet" from "no default Content-Type".
+_UNSET = object()
+
+# Pre-resolved enum values for the per-request hot path.
+_CONTENT_TYPE_HEADER = Header.CONTENT_TYPE.value
+_JSON_CONTENT_TYPE = ContentType.JSON.value
+
+# Lower-cased header names, computed once instead of per lookup.
+_HEADER_NAME_LC = {header: header.value.lower() for header in Header}
 
 _RAW_BODY_CONTENT_TYPES = frozenset(
     {
@@ -30,6 +65,34 @@ _RAW_BODY_CONTENT_TYPES = frozenset(
     }
 )
 
+# Query-parameter value types that str() encodes the same way urlencode
+# would; anything else (lists, None, ...) is left to the HTTP backend.
+_SCALAR_QUERY_TYPES = (str, int, float, bool)
+
+
+@functools.lru_cache(maxsize=1)
+def _accept_encoding() -> str:
+    """Return the Accept-Encoding value matching the installed decoders.
+
+    Brotli is only advertised when a decoder is importable; advertising it
+    blindly would let servers reply with bodies the client cannot decode.
+    """
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return "gzip, deflate"
+    return "br, gzip, deflate"
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_query_string(items: tuple[tuple[str, str], ...]) -> str:
+    """Encode sorted query items once; hot endpoints reuse a small set of
+    parameter combinations, so repeated calls hit the cache."""
+    return urlencode(items)
+
 
 @base_class
 class AbstractGateway(
@@ -39,6 +102,15 @@ class AbstractGateway(
 ):
     # Base configuration
     base_url: str | None = public_field(default=None, description="Base API URL")
+    cache_enabled: bool = public_field(
+        default=False,
+        description="If True, GET responses are cached client-side and served "
+        "or revalidated (ETag/If-Modified-Since) instead of re-fetched",
+    )
+    cache_max_entries: int = public_field(
+        default=128,
+        description="Maximum number of cached GET responses before LRU eviction",
+    )
     # State
     connected: bool = public_field(default=False, description="Connection state")
     # Default request configuration
@@ -54,10 +126,67 @@ class AbstractGateway(
     quiet: bool = public_field(
         default=False, description="If True, only show errors and warnings"
     )
+    rate_limit_burst: int = public_field(
+        default=1,
+        description="Number of requests allowed to burst before the rate limit applies",
+    )
     rate_limit_delay: float = public_field(
         default=1.0, description="Minimum delay between requests in seconds"
     )
+    response_preview_limit: int = public_field(
+        default=4096,
+        description="Maximum number of body bytes read when previewing a "
+        "response for logs and error messages",
+    )
     timeout: int = public_field(default=30, description="Request timeout in seconds")
+    use_http2: bool = public_field(
+        default=False,
+        description="If True, send sync requests over a shared httpx HTTP/2 "
+        "client so same-host calls multiplex one connection (requires the "
+        "'http2' extra)",
+    )
+    _async_session: Any = private_field(
+        default=None,
+        description="Shared aiohttp.ClientSession for the async request path; "
+        "created lazily inside the running event loop and bounded per host.",
+    )
+    _base_url_stripped: Any = private_field(
+        default=_UNSET,
+        description="get_base_url() with its trailing slash removed, computed "
+        "once instead of re-stripping a constant string per request.",
+    )
+    _default_content_type: Any = private_field(
+        default=_UNSET,
+        description="Normalized Content-Type from default_headers, computed "
+        "once instead of scanning the headers on every request.",
+    )
+    _httpx_client: Any = private_field(
+        default=None,
+        description="Shared httpx.Client used when use_http2 is enabled; "
+        "created lazily like the requests session.",
+    )
+    _lazy_init_lock: threading.Lock = private_field(
+        factory=threading.Lock,
+        description="Guards lazy creation of the shared singletons (session, "
+        "bucket, caches) so concurrent first calls cannot mint duplicates.",
+    )
+    _rate_limit_bucket: TokenBucket | None = private_field(
+        default=None,
+        description="Token bucket derived from rate_limit_delay/rate_limit_burst; "
+        "lets bursts proceed immediately while sustained traffic converges to "
+        "the configured rate.",
+    )
+    _response_cache: OrderedDict[str, CachedResponse] | None = private_field(
+        default=None,
+        description="LRU cache of GET responses keyed on method, URL and "
+        "sorted query parameters.",
+    )
+    _session: requests.Session | None = private_field(
+        default=None,
+        description="Pooled HTTP session shared by all requests; created lazily so "
+        "keep-alive connections are reused instead of paying a new TCP/TLS "
+        "handshake per call.",
+    )
 
     @classmethod
     def get_class_name_suffix(cls) -> str | None:
@@ -77,19 +206,41 @@ class AbstractGateway(
     def clear_error(self) -> None:
         self.last_exception = None
 
+    async def close_async(self) -> None:
+        """Close the shared async session and release its connections."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+
     def connect(self) -> bool:
+        self._get_session()
         self.connected = True
         return True
 
-    def format_response_content(self, response: requests.Response | None) -> str:
-        """Extract and format response content for logging."""
+    def format_response_content(
+        self, response: requests.Response | HttpResponse | None
+    ) -> str:
+        """Extract a bounded preview of response content for logging.
+
+        Slices at most `response_preview_limit` bytes of the already-read
+        body so logging a large (e.g. error) response never parses it
+        fully; a still-unread stream is reported as a placeholder rather
+        than consumed.
+        """
         if response is None:
             return "Null response"
 
-        try:
-            return response.json()
-        except (ValueError, AttributeError):
+        buffer = self._read_preview(response)
+        if buffer is None:
+            if self._is_body_unread(response):
+                # Consuming a live stream here would truncate what the
+                # caller reads afterwards; log a placeholder instead.
+                return "<streamed body not read>"
             return response.text
+        try:
+            return orjson.loads(buffer)
+        except (orjson.JSONDecodeError, TypeError):
+            return buffer.decode("utf-8", errors="replace")
 
     def get_base_url(self) -> str | None:
         return self.base_url
@@ -102,7 +253,7 @@ class AbstractGateway(
 
     def handle_api_response(
         self,
-        response: requests.Response | None,
+        response: requests.Response | HttpResponse | None,
         request_context: HttpRequestPayload,
         exception: Exception | None = None,
         fatal_on_error: bool = False,
@@ -134,13 +285,14 @@ class AbstractGateway(
         if response.status_code in request_context.expected_status_codes:
             return response
 
-        # Combine request details with response content
-        details = {
-            **self._create_request_details(request_context, response.status_code),
-            "Response Content": self.format_response_content(response),
-        }
-
         if not is_quiet:
+            # Combining request details with the response content parses the
+            # body, so skip all of it when logging is suppressed (e.g. the
+            # quiet path used by check_status_code).
+            details = {
+                **self._create_request_details(request_context, response.status_code),
+                "Response Content": self.format_response_content(response),
+            }
             self.io.properties(details, title="Request Details")
 
         self.io.error(
@@ -172,8 +324,6 @@ class AbstractGateway(
         raise_exceptions: bool = False,
         retries: int = 0,
     ) -> requests.Response | None:
-        from wexample_helpers.error.gateway_error import GatewayError
-
         if retries > 0:
             from wexample_helpers.helper.retryable_callback_manager import (
                 RetryableCallbackManager,
@@ -206,31 +356,81 @@ class AbstractGateway(
                 ),
             ).run()
 
-        from wexample_api.common.http_request_payload import HttpRequestPayload
-        from wexample_api.enums.http import Header
-
+        # Default headers live on the pooled session; only caller-provided
+        # headers travel on the payload, avoiding a dict merge per call.
         payload = HttpRequestPayload.from_endpoint(
-            base_url=self.get_base_url(),
+            base_url=self._get_base_url_stripped(),
             endpoint=endpoint,
             method=method,
             data=data,
             query_params=query_params,
-            headers={**self.default_headers, **(headers or {})},
+            headers=headers,
             call_origin=call_origin,
             expected_status_codes=expected_status_codes,
         )
 
+        if payload.query_params and all(
+            isinstance(v, _SCALAR_QUERY_TYPES) for v in payload.query_params.values()
+        ):
+            # Bake the memoized query string into the URL so the backend
+            # does not re-encode the same parameter dict on every call.
+            query_string = _encode_query_string(
+                tuple(sorted((k, str(v)) for k, v in payload.query_params.items()))
+            )
+            separator = "&" if "?" in payload.url else "?"
+            payload.url = f"{payload.url}{separator}{query_string}"
+            payload.query_params = None
+
         if not self.connected:
             self.connect()
 
+        # Serve idempotent GETs from the client-side cache when possible;
+        # stale entries piggyback their validators on the outgoing request.
+        cache_key: str | None = None
+        cached_entry: CachedResponse | None = None
+        if (
+            self.cache_enabled
+            and payload.method is HttpMethod.GET
+            and not files
+            and not stream
+        ):
+            cache_key = self._cache_key(payload)
+            cached_entry = self._cache_lookup(cache_key)
+            if cached_entry is not None:
+                if cached_entry.is_fresh():
+                    return self.handle_api_response(
+                        response=self._build_cached_response(
+                            cached_entry, payload.url
+                        ),
+                        request_context=payload,
+                        fatal_on_error=fatal_if_unexpected,
+                        quiet=quiet,
+                    )
+                validators: dict[str, str] = {}
+                if cached_entry.etag:
+                    validators["If-None-Match"] = cached_entry.etag
+                if cached_entry.last_modified:
+                    validators["If-Modified-Since"] = cached_entry.last_modified
+                if validators:
+                    payload.headers = {**(payload.headers or {}), **validators}
+
         self._handle_rate_limiting()
 
-        # Determine how to send the data based on Content-Type header
-        content_type = self._get_header_value(payload.headers, Header.CONTENT_TYPE)
+        # Determine how to send the data based on Content-Type header,
+        # falling back to the precomputed session-wide default.
+        content_type = (
+            self._get_header_value(payload.headers, Header.CONTENT_TYPE)
+            if payload.headers
+            else None
+        ) or self._get_default_content_type()
 
         if files:
             content_type = ContentType.MULTIPART.value
-            payload.headers.pop(Header.CONTENT_TYPE.value, None)
+            if payload.headers:
+                payload.headers.pop(_CONTENT_TYPE_HEADER, None)
+            # A None value tells requests to drop any Content-Type inherited
+            # from the session so the multipart boundary can be computed.
+            payload.headers = {**(payload.headers or {}), _CONTENT_TYPE_HEADER: None}
 
         request_kwargs: dict[str, Any] = {
             "method": payload.method.value,
@@ -244,16 +444,27 @@ class AbstractGateway(
         if files:
             request_kwargs["data"] = data or {}
             request_kwargs["files"] = files
-        elif content_type in _RAW_BODY_CONTENT_TYPES:
+        elif content_type in _RAW_BODY_CONTENT_TYPES or isinstance(data, bytes):
             request_kwargs["data"] = data
-        else:
-            request_kwargs["json"] = data
+        elif data is not None:
+            # Pre-serialize with orjson instead of letting requests run the
+            # body through stdlib json.
+            request_kwargs["data"] = self._encode_json(data)
+            if content_type is None:
+                payload.headers = {
+                    **(payload.headers or {}),
+                    _CONTENT_TYPE_HEADER: _JSON_CONTENT_TYPE,
+                }
+                request_kwargs["headers"] = payload.headers
 
         try:
-            response = requests.request(**request_kwargs)
-        except requests.exceptions.RequestException as exc:
-            gateway_error = GatewayError(f"Request failed: {exc}")
-            gateway_error.__cause__ = exc
+            response = self._send_request(request_kwargs)
+        except (requests.exceptions.RequestException, GatewayError) as exc:
+            if isinstance(exc, GatewayError):
+                gateway_error = exc
+            else:
+                gateway_error = GatewayError(f"Request failed: {exc}")
+                gateway_error.__cause__ = exc
 
             if raise_exceptions:
                 raise gateway_error
@@ -266,15 +477,17 @@ class AbstractGateway(
                 quiet=quiet,
             )
 
+        self._apply_rate_limit_headers(response)
+
+        if cache_key is not None:
+            response = self._cache_response(
+                cache_key, cached_entry, response, payload.url
+            )
+
         # Only check status code if expected_status_codes is explicitly provided
         exception = None
-        if expected_status_codes is not None:
-            expected = (
-                {expected_status_codes}
-                if isinstance(expected_status_codes, int)
-                else set(expected_status_codes)
-            )
-            if response.status_code not in expected:
+        if payload.expected_status_codes is not None:
+            if response.status_code not in payload.expected_status_codes:
                 exception = GatewayError(self._extract_error_message(response))
                 exception.response = (
                     response  # Attach response to exception for debugging
@@ -290,12 +503,376 @@ class AbstractGateway(
             quiet=quiet,
         )
 
+    async def make_request_async(
+        self,
+        endpoint: str,
+        method: HttpMethod = HttpMethod.GET,
+        data: dict[str, Any] | bytes | None = None,
+        query_params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        call_origin: str | None = None,
+        expected_status_codes: int | list[int] | None = None,
+        fatal_if_unexpected: bool = False,
+        quiet: bool = False,
+        timeout: int | None = None,
+        raise_exceptions: bool = False,
+    ) -> HttpResponse | None:
+        """Async counterpart of `make_request` for concurrent fan-out.
+
+        Runs on a shared `aiohttp.ClientSession` whose connector bounds
+        per-host concurrency, so independent calls can be gathered without
+        serializing their round trips. Requires the `async` extra (aiohttp).
+        """
+        import aiohttp
+
+        from wexample_api.common.http_response import HttpResponse
+
+        payload = HttpRequestPayload.from_endpoint(
+            base_url=self._get_base_url_stripped(),
+            endpoint=endpoint,
+            method=method,
+            data=data,
+            query_params=query_params,
+            headers=headers,
+            call_origin=call_origin,
+            expected_status_codes=expected_status_codes,
+        )
+
+        if payload.query_params and all(
+            isinstance(v, _SCALAR_QUERY_TYPES) for v in payload.query_params.values()
+        ):
+            # Bake the memoized query string into the URL so the backend
+            # does not re-encode the same parameter dict on every call.
+            query_string = _encode_query_string(
+                tuple(sorted((k, str(v)) for k, v in payload.query_params.items()))
+            )
+            separator = "&" if "?" in payload.url else "?"
+            payload.url = f"{payload.url}{separator}{query_string}"
+            payload.query_params = None
+
+        if not self.connected:
+            self.connect()
+
+        await self._handle_rate_limiting_async()
+
+        content_type = (
+            self._get_header_value(payload.headers, Header.CONTENT_TYPE)
+            if payload.headers
+            else None
+        ) or self._get_default_content_type()
+
+        request_kwargs: dict[str, Any] = {
+            "method": payload.method.value,
+            "url": payload.url,
+            "params": payload.query_params,
+            "headers": payload.headers,
+            "timeout": aiohttp.ClientTimeout(total=timeout or self.timeout),
+        }
+
+        if content_type in _RAW_BODY_CONTENT_TYPES or isinstance(data, bytes):
+            request_kwargs["data"] = data
+        elif data is not None:
+            request_kwargs["data"] = self._encode_json(data)
+            if content_type is None:
+                payload.headers = {
+                    **(payload.headers or {}),
+                    _CONTENT_TYPE_HEADER: _JSON_CONTENT_TYPE,
+                }
+                request_kwargs["headers"] = payload.headers
+
+        try:
+            async with self._get_async_session().request(
+                **request_kwargs
+            ) as aio_response:
+                response = HttpResponse(
+                    content=await aio_response.read(),
+                    headers=dict(aio_response.headers),
+                    status_code=aio_response.status,
+                    url=str(aio_response.url),
+                )
+        except aiohttp.ClientError as exc:
+            gateway_error = GatewayError(f"Request failed: {exc}")
+            gateway_error.__cause__ = exc
+
+            if raise_exceptions:
+                raise gateway_error
+
+            return self.handle_api_response(
+                response=None,
+                request_context=payload,
+                exception=gateway_error,
+                fatal_on_error=fatal_if_unexpected,
+                quiet=quiet,
+            )
+
+        self._apply_rate_limit_headers(response)
+
+        exception = None
+        if payload.expected_status_codes is not None:
+            if response.status_code not in payload.expected_status_codes:
+                exception = GatewayError(self._extract_error_message(response))
+                exception.response = response
+                if raise_exceptions:
+                    raise exception
+
+        return self.handle_api_response(
+            response=response,
+            request_context=payload,
+            exception=exception,
+            fatal_on_error=fatal_if_unexpected,
+            quiet=quiet,
+        )
+
+    def make_requests_batch(
+        self,
+        payloads: list[HttpRequestPayload],
+        batch_endpoint: str = "/$batch",
+        max_batch_size: int = 20,
+        call_origin: str | None = None,
+        quiet: bool = False,
+        timeout: int | None = None,
+    ) -> list[HttpResponse]:
+        """Send several requests in a single round trip via a $batch endpoint.
+
+        Payloads are grouped into chunks of `max_batch_size`, each chunk is
+        POSTed as a multipart/mixed body whose parts are application/http
+        messages (one per payload), and the multipart response is split back
+        into one `HttpResponse` per part, in request order.
+        """
+        import uuid
+
+        responses: list[HttpResponse] = []
+        for start in range(0, len(payloads), max_batch_size):
+            chunk = payloads[start : start + max_batch_size]
+            boundary = f"batch_{uuid.uuid4().hex}"
+            body_parts = [
+                f"--{boundary}\r\nContent-Type: application/http\r\n\r\n"
+                f"{payload.to_batch_part()}"
+                for payload in chunk
+            ]
+            body = "\r\n".join(body_parts) + f"\r\n--{boundary}--\r\n"
+
+            response = self.make_request(
+                endpoint=batch_endpoint,
+                method=HttpMethod.POST,
+                data=body.encode("utf-8"),
+                headers={
+                    _CONTENT_TYPE_HEADER: f"multipart/mixed; boundary={boundary}"
+                },
+                call_origin=call_origin,
+                expected_status_codes=200,
+                quiet=quiet,
+                timeout=timeout,
+                raise_exceptions=True,
+            )
+            if response is None:
+                raise GatewayError("Batch request returned no response")
+
+            responses.extend(self._parse_batch_response(response))
+        return responses
+
     def setup(self) -> AbstractGateway:
-        if self.default_headers is None:
-            self.default_headers = {}
+        # Promote default headers to a case-insensitive mapping so later
+        # lookups are O(1) instead of linear scans.
+        self.default_headers = CaseInsensitiveDict(self.default_headers or {})
+
+        self._get_session()
+        self._get_base_url_stripped()
+        self._get_default_content_type()
 
         return self
 
+    def stream_json(
+        self,
+        endpoint: str,
+        path: str = "item",
+        method: HttpMethod = HttpMethod.GET,
+        query_params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        expected_status_codes: int | list[int] | None = 200,
+        call_origin: str | None = None,
+        timeout: int | None = None,
+    ) -> Iterator[Any]:
+        """Yield items of a JSON response as they are parsed off the wire.
+
+        Decodes the body incrementally with ijson (install the `stream`
+        extra) instead of materializing it with json(): peak memory stays
+        at one item and iteration starts before the full body has arrived.
+        `path` follows ijson semantics — the default "item" iterates a
+        top-level array. Raises GatewayError on an unexpected status code,
+        since a generator has no None to return.
+        """
+        import ijson
+
+        payload = HttpRequestPayload.from_endpoint(
+            base_url=self._get_base_url_stripped(),
+            endpoint=endpoint,
+            method=method,
+            query_params=query_params,
+            headers=headers,
+            call_origin=call_origin,
+            expected_status_codes=expected_status_codes,
+        )
+
+        if not self.connected:
+            self.connect()
+
+        self._handle_rate_limiting()
+
+        with self._get_session().request(
+            method=payload.method.value,
+            url=payload.url,
+            params=payload.query_params,
+            headers=payload.headers,
+            timeout=timeout if timeout is not None else self.timeout,
+            stream=True,
+        ) as response:
+            self._apply_rate_limit_headers(response)
+            if (
+                payload.expected_status_codes is not None
+                and response.status_code not in payload.expected_status_codes
+            ):
+                exception = GatewayError(self._extract_error_message(response))
+                exception.response = response
+                raise exception
+
+            # urllib3 hands out the raw, possibly compressed stream; have
+            # it undo the content encoding so ijson sees plain JSON bytes.
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, path)
+
+    def _apply_rate_limit_headers(
+        self, response: requests.Response | HttpResponse
+    ) -> None:
+        """Back off proactively when the server signals quota exhaustion."""
+        bucket = self._get_rate_limit_bucket()
+        headers = getattr(response, "headers", None)
+        if bucket is None or not headers:
+            return
+
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                bucket.reserve(float(retry_after))
+            except (TypeError, ValueError):
+                # HTTP-date form of Retry-After; not worth parsing here.
+                pass
+            return
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            if int(remaining) <= 0:
+                reset_value = float(reset)
+                # Reset is either a delay in seconds or an epoch timestamp.
+                delay = (
+                    reset_value - time.time() if reset_value > 1e6 else reset_value
+                )
+                if delay > 0:
+                    bucket.reserve(delay)
+        except (TypeError, ValueError):
+            pass
+
+    def _build_cached_response(
+        self, entry: CachedResponse, url: str
+    ) -> requests.Response:
+        """Synthesize a requests.Response from a cache entry."""
+        response = requests.Response()
+        response.status_code = entry.status_code
+        response._content = entry.content
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.url = url
+        return response
+
+    def _cache_expiry(self, headers: Mapping[str, str]) -> float | None:
+        """Compute the wall-clock freshness deadline from response headers."""
+        cache_control = headers.get("Cache-Control")
+        if cache_control:
+            for directive in cache_control.split(","):
+                directive = directive.strip()
+                if directive in ("no-cache", "no-store"):
+                    return None
+                if directive.startswith("max-age="):
+                    try:
+                        return time.time() + int(directive[len("max-age=") :])
+                    except ValueError:
+                        return None
+
+        expires = headers.get("Expires")
+        if expires:
+            from email.utils import parsedate_to_datetime
+
+            try:
+                return parsedate_to_datetime(expires).timestamp()
+            except (TypeError, ValueError):
+                return None
+        return None
+
+    def _cache_key(self, payload: HttpRequestPayload) -> str:
+        from urllib.parse import urlencode
+
+        params = payload.query_params or {}
+        encoded = urlencode(sorted((k, str(v)) for k, v in params.items()))
+        return f"{payload.method.value}|{payload.url}|{encoded}"
+
+    def _cache_lookup(self, key: str) -> CachedResponse | None:
+        cache = self._get_response_cache()
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+        return entry
+
+    def _cache_response(
+        self,
+        key: str,
+        entry: CachedResponse | None,
+        response: requests.Response,
+        url: str,
+    ) -> requests.Response:
+        """Store or revalidate a cache entry from a network response.
+
+        Returns the response callers should keep working with: the synthesized
+        cached one on 304, the network response otherwise.
+        """
+        from wexample_api.common.response_cache import CachedResponse
+
+        cache = self._get_response_cache()
+
+        if response.status_code == 304 and entry is not None:
+            expires_at = self._cache_expiry(response.headers)
+            if expires_at is not None:
+                entry.expires_at = expires_at
+            cache.move_to_end(key)
+            return self._build_cached_response(entry, url)
+
+        if response.status_code == 200:
+            headers = dict(response.headers or {})
+            if "no-store" in (headers.get("Cache-Control") or ""):
+                cache.pop(key, None)
+                return response
+            etag = headers.get("ETag")
+            last_modified = headers.get("Last-Modified")
+            expires_at = self._cache_expiry(response.headers)
+            # Without freshness information or a validator the entry could
+            # never be served nor revalidated, so skip it.
+            if etag is None and last_modified is None and expires_at is None:
+                return response
+            cache[key] = CachedResponse(
+                content=response.content,
+                etag=etag,
+                expires_at=expires_at,
+                headers=headers,
+                last_modified=last_modified,
+                status_code=response.status_code,
+            )
+            cache.move_to_end(key)
+            while len(cache) > self.cache_max_entries:
+                cache.popitem(last=False)
+
+        return response
+
     def _create_request_details(
         self, request_context: HttpRequestPayload, status_code: int | None = None
     ) -> dict[str, Any]:
@@ -321,22 +898,67 @@ class AbstractGateway(
             details["Status"] = status_code
         return details
 
-    def _extract_error_message(self, response: requests.Response) -> str:
+    def _encode_json(self, obj: Any) -> bytes:
+        """Serialize a request body to JSON bytes with orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _extract_error_message(
+        self, response: requests.Response | HttpResponse
+    ) -> str:
         """Extract error message from response."""
         message = f"HTTP {response.status_code}"
+        buffer = self._read_preview(response)
         try:
-            data = response.json()
+            data = orjson.loads(buffer)
             if isinstance(data, dict):
                 message = data.get("message", data.get("error", message))
-        except (ValueError, AttributeError):
-            if response.text:
+        except (orjson.JSONDecodeError, TypeError):
+            if buffer:
+                message = buffer.decode("utf-8", errors="replace")
+            elif (
+                buffer is None
+                and not self._is_body_unread(response)
+                and response.text
+            ):
                 message = response.text
         # GitLab returns a nested dict (e.g. validation errors) under "message";
         # keep the full content but as a string so it can flow through exceptions.
         if not isinstance(message, str):
-            message = json.dumps(message, default=str)
+            message = orjson.dumps(message, default=str).decode("utf-8")
         return message
 
+    def _get_async_session(self) -> Any:
+        """Return the shared aiohttp session, creating it on first use.
+
+        Must be called from within a running event loop.
+        """
+        import aiohttp
+
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=_ASYNC_LIMIT_PER_HOST,
+                    keepalive_timeout=_ASYNC_KEEPALIVE_TIMEOUT,
+                ),
+                headers=self.default_headers or {},
+            )
+        return self._async_session
+
+    def _get_base_url_stripped(self) -> str | None:
+        """Return get_base_url() without its trailing slash, cached."""
+        if self._base_url_stripped is _UNSET:
+            base_url = self.get_base_url()
+            self._base_url_stripped = base_url.rstrip("/") if base_url else None
+        return self._base_url_stripped
+
+    def _get_default_content_type(self) -> str | None:
+        """Return the normalized Content-Type of default_headers, cached."""
+        if self._default_content_type is _UNSET:
+            self._default_content_type = self._get_header_value(
+                self.default_headers, Header.CONTENT_TYPE
+            )
+        return self._default_content_type
+
     def _get_header_value(
         self,
         headers: Mapping[str, str] | None,
@@ -350,21 +972,229 @@ class AbstractGateway(
         """
         if not headers:
             return None
-        target = name.value.lower()
-        raw = next(
-            (v for k, v in headers.items() if k.lower() == target),
-            None,
-        )
+        if isinstance(headers, CaseInsensitiveDict):
+            # O(1) case-insensitive lookup instead of scanning and lowering
+            # every key.
+            raw = headers.get(name.value)
+        else:
+            target = _HEADER_NAME_LC[name]
+            raw = next(
+                (v for k, v in headers.items() if k.lower() == target),
+                None,
+            )
         if raw is None:
             return None
 
         return raw.split(";", 1)[0].strip().lower() or None
 
+    def _get_httpx_client(self) -> Any:
+        """Return the shared httpx HTTP/2 client, creating it on first use."""
+        import httpx
+
+        if self._httpx_client is None:
+            with self._lazy_init_lock:
+                if self._httpx_client is None:
+                    self._httpx_client = httpx.Client(
+                        http2=True,
+                        limits=httpx.Limits(
+                            max_connections=_HTTP2_MAX_CONNECTIONS,
+                            max_keepalive_connections=_HTTP2_MAX_KEEPALIVE_CONNECTIONS,
+                        ),
+                        timeout=self.timeout,
+                        headers=self.default_headers or {},
+                    )
+        return self._httpx_client
+
+    def _get_rate_limit_bucket(self) -> TokenBucket | None:
+        if self.rate_limit_delay <= 0:
+            return None
+        if self._rate_limit_bucket is None:
+            from wexample_api.common.token_bucket import TokenBucket
+
+            with self._lazy_init_lock:
+                if self._rate_limit_bucket is None:
+                    self._rate_limit_bucket = TokenBucket(
+                        rate=1.0 / self.rate_limit_delay,
+                        capacity=float(max(1, self.rate_limit_burst)),
+                    )
+        return self._rate_limit_bucket
+
+    def _get_response_cache(self) -> OrderedDict[str, CachedResponse]:
+        if self._response_cache is None:
+            from collections import OrderedDict
+
+            with self._lazy_init_lock:
+                if self._response_cache is None:
+                    self._response_cache = OrderedDict()
+        return self._response_cache
+
+    def _get_session(self) -> requests.Session:
+        """Return the shared keep-alive session, creating it on first use.
+
+        Creation is double-checked under the lazy-init lock so concurrent
+        first callers (e.g. a thread pool sharing one gateway) cannot mint
+        duplicate sessions and leak their connection pools.
+        """
+        if self._session is None:
+            with self._lazy_init_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    session.headers.update(self.default_headers or {})
+                    # Negotiate the best compression the client can actually
+                    # decode; an explicit default header keeps precedence.
+                    if (
+                        self._get_header_value(
+                            self.default_headers, Header.ACCEPT_ENCODING
+                        )
+                        is None
+                    ):
+                        session.headers[Header.ACCEPT_ENCODING.value] = (
+                            _accept_encoding()
+                        )
+                    adapter = HTTPAdapter(
+                        pool_connections=_POOL_CONNECTIONS,
+                        pool_maxsize=_POOL_MAXSIZE,
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
     def _handle_rate_limiting(self) -> None:
-        now = time.time()
-        if self.last_request_time is not None:
-            elapsed = now - self.last_request_time
-            if elapsed < self.rate_limit_delay:
-                time.sleep(self.rate_limit_delay - elapsed)
-                now = time.time()
-        self.last_request_time = now
+        bucket = self._get_rate_limit_bucket()
+        if bucket is not None:
+            bucket.acquire()
+        self.last_request_time = time.time()
+
+    async def _handle_rate_limiting_async(self) -> None:
+        bucket = self._get_rate_limit_bucket()
+        if bucket is not None:
+            await bucket.acquire_async()
+        self.last_request_time = time.time()
+
+    def _is_body_unread(self, response: Any) -> bool:
+        """Whether the response is a live stream whose body was not read yet.
+
+        requests keeps `_content` as the sentinel False until the body has
+        been consumed (stream=True and nobody accessed `content`); such a
+        body still belongs to the caller and must not be touched for
+        logging previews or error messages.
+        """
+        return getattr(response, "_content", None) is False
+
+    def _parse_batch_response(
+        self, response: requests.Response | HttpResponse
+    ) -> list[HttpResponse]:
+        """Split a multipart/mixed batch response into individual responses."""
+        content_type = response.headers.get("Content-Type", "")
+        boundary = None
+        for param in content_type.split(";"):
+            param = param.strip()
+            if param.startswith("boundary="):
+                boundary = param[len("boundary=") :].strip('"')
+                break
+        if not boundary:
+            raise GatewayError(
+                f"Batch response is not multipart (Content-Type: {content_type})"
+            )
+
+        responses: list[HttpResponse] = []
+        for part in response.content.split(b"--" + boundary.encode("utf-8")):
+            part = part.strip(b"\r\n")
+            if not part or part == b"--":
+                continue
+            # Drop the outer part headers (Content-Type: application/http)
+            # to get at the embedded HTTP message.
+            for separator in (b"\r\n\r\n", b"\n\n"):
+                if separator in part:
+                    part = part.split(separator, 1)[1]
+                    break
+            responses.append(self._parse_http_message(part))
+        return responses
+
+    def _parse_http_message(self, message: bytes) -> HttpResponse:
+        """Parse a raw application/http response message."""
+        from wexample_api.common.http_response import HttpResponse
+
+        separator = b"\r\n\r\n" if b"\r\n\r\n" in message else b"\n\n"
+        head, _, body = message.partition(separator)
+        lines = head.decode("latin-1").splitlines()
+        if not lines:
+            raise GatewayError("Empty batch response part")
+        status_parts = lines[0].split(" ", 2)
+        try:
+            status_code = int(status_parts[1])
+        except (IndexError, ValueError) as exc:
+            raise GatewayError(
+                f"Malformed status line in batch response part: {lines[0]!r}"
+            ) from exc
+
+        headers: dict[str, str] = {}
+        for line in lines[1:]:
+            key, _, value = line.partition(":")
+            if key:
+                headers[key.strip()] = value.strip()
+
+        return HttpResponse(
+            content=body,
+            headers=headers,
+            status_code=status_code,
+        )
+
+    def _read_preview(
+        self, response: requests.Response | HttpResponse
+    ) -> bytes | None:
+        """Return at most `response_preview_limit` bytes of a response body.
+
+        Only slices an already-materialized body; a still-live stream (see
+        `_is_body_unread`) is left untouched and yields None, as reading a
+        preview from it would silently drop those bytes from what the
+        caller iterates afterwards. Returns None when no materialized
+        bytes are available.
+        """
+        if self._is_body_unread(response):
+            return None
+        content = getattr(response, "content", None)
+        if isinstance(content, bytes):
+            return content[: self.response_preview_limit]
+        return None
+
+    def _send_request(self, request_kwargs: dict[str, Any]) -> Any:
+        """Dispatch a prepared request to the configured sync backend."""
+        if self.use_http2:
+            return self._send_request_http2(request_kwargs)
+        return self._get_session().request(**request_kwargs)
+
+    def _send_request_http2(self, request_kwargs: dict[str, Any]) -> Any:
+        """Send a prepared request over the shared httpx HTTP/2 client.
+
+        httpx.Response exposes the same status_code/json()/text/content
+        surface as requests.Response, so downstream handling is unchanged.
+        The `stream` flag is ignored on this path (httpx streams via a
+        separate API); httpx errors are wrapped into GatewayError like the
+        requests path does.
+        """
+        import httpx
+
+        httpx_kwargs: dict[str, Any] = {
+            "method": request_kwargs["method"],
+            "url": request_kwargs["url"],
+            "params": request_kwargs.get("params"),
+            "headers": request_kwargs.get("headers"),
+            "timeout": request_kwargs.get("timeout"),
+        }
+        data = request_kwargs.get("data")
+        if request_kwargs.get("files") is not None:
+            httpx_kwargs["files"] = request_kwargs["files"]
+            httpx_kwargs["data"] = data
+        elif isinstance(data, bytes):
+            httpx_kwargs["content"] = data
+        elif data is not None:
+            httpx_kwargs["data"] = data
+
+        try:
+            return self._get_httpx_client().request(**httpx_kwargs)
+        except httpx.HTTPError as exc:
+            gateway_error = GatewayError(f"Request failed: {exc}")
+            gateway_error.__cause__ = exc
+            raise gateway_error
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import string
+import types
+from typing import TYPE_CHECKING, Any, Callable
+
+from wexample_api.enums.http import HttpMethod
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+# Methods whose extra keyword arguments become the request body; for all
+# other methods they become query parameters.
+_BODY_METHODS = frozenset({HttpMethod.PATCH, HttpMethod.POST, HttpMethod.PUT})
+
+
+class _EndpointMethod:
+    """Method-like attribute that adopts the name it is assigned to.
+
+    __set_name__ renames the generated closure after its class attribute,
+    so tracebacks, profiler output and help() show e.g.
+    `JsonPlaceholderGateway.get_post` instead of
+    `endpoint.<locals>.request`.
+    """
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        self._func = func
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Callable[..., Any]:
+        if instance is None:
+            return self._func
+        return types.MethodType(self._func, instance)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._func.__name__ = name
+        self._func.__qualname__ = f"{owner.__qualname__}.{name}"
+
+
+def endpoint(
+    method: HttpMethod,
+    path: str,
+    expected_status_codes: int | list[int] = 200,
+    call_origin: str | None = None,
+) -> _EndpointMethod:
+    """Build a gateway method from per-endpoint constants.
+
+    Hand-written wrappers around `make_request` repeat the same plumbing
+    with different constants. This factory evaluates those constants once
+    at class build time — the path template is parsed for placeholders,
+    the status codes are normalized into a frozenset — so each call only
+    fills in the variable parts:
+
+        class JsonPlaceholderGateway(AbstractGateway):
+            get_post = endpoint(HttpMethod.GET, "/posts/{post_id}")
+
+    Positional arguments and keyword arguments matching a path
+    placeholder are formatted into the endpoint; remaining keyword
+    arguments become the request body for PATCH/POST/PUT and query
+    parameters otherwise. Returns the parsed JSON body, or None when the
+    request failed.
+    """
+    placeholders = tuple(
+        field for _, field, _, _ in string.Formatter().parse(path) if field
+    )
+    if isinstance(expected_status_codes, int):
+        status_codes = frozenset((expected_status_codes,))
+    else:
+        status_codes = frozenset(expected_status_codes)
+    kwargs_to_body = method in _BODY_METHODS
+
+    def request(self: AbstractGateway, *args: Any, **kwargs: Any) -> Any:
+        if placeholders:
+            values = dict(zip(placeholders, args))
+            values.update(
+                (name, kwargs.pop(name)) for name in placeholders if name in kwargs
+            )
+            resolved = path.format(**values)
+        else:
+            resolved = path
+        response = self.make_request(
+            endpoint=resolved,
+            method=method,
+            data=kwargs or None if kwargs_to_body else None,
+            query_params=None if kwargs_to_body else kwargs or None,
+            expected_status_codes=status_codes,
+            call_origin=call_origin,
+        )
+        return response.json() if response else None
+
+    request.__doc__ = f"Request {method.value} {path} and return its JSON body."
+    return _EndpointMethod(request)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class HttpResponse(BaseClass):
+    """Backend-agnostic HTTP response container.
+
+    Mirrors the subset of the ``requests.Response`` surface consumed by
+    ``AbstractGateway.handle_api_response`` so responses coming from other
+    backends (e.g. aiohttp) can flow through the same handling code.
+    """
+
+    content: bytes = public_field(
+        default=b"",
+        description="Raw response body",
+    )
+    headers: dict[str, str] = public_field(
+        factory=dict,
+        description="Response headers",
+    )
+    status_code: int = public_field(
+        default=200,
+        description="HTTP status code of the response",
+    )
+    url: str | None = public_field(
+        default=None,
+        description="Final URL the response was served from",
+    )
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return orjson.loads(self.content)
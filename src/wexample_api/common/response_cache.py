@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import time
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class CachedResponse(BaseClass):
+    """One cached GET response plus the validators needed to revalidate it.
+
+    An entry is served directly while fresh (per `Cache-Control: max-age` or
+    `Expires`); once stale, its `etag`/`last_modified` validators are sent as
+    `If-None-Match`/`If-Modified-Since` so the server can answer 304 instead
+    of resending the body.
+    """
+
+    content: bytes = public_field(
+        default=b"",
+        description="Cached response body",
+    )
+    etag: str | None = public_field(
+        default=None,
+        description="ETag validator from the original response",
+    )
+    expires_at: float | None = public_field(
+        default=None,
+        description="Wall-clock time until which the entry is fresh, or None "
+        "when the entry always requires revalidation",
+    )
+    headers: dict[str, str] = public_field(
+        factory=dict,
+        description="Headers of the original response",
+    )
+    last_modified: str | None = public_field(
+        default=None,
+        description="Last-Modified validator from the original response",
+    )
+    status_code: int = public_field(
+        default=200,
+        description="HTTP status code of the original response",
+    )
+
+    def is_fresh(self) -> bool:
+        return self.expires_at is not None and time.time() < self.expires_at
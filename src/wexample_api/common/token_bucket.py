@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class TokenBucket(BaseClass):
+    """Token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    `acquire()` consumes one token and only sleeps when the bucket is empty.
+    Bursts up to `capacity` requests proceed immediately instead of paying a
+    fixed delay per request, while sustained traffic converges to `rate`.
+    """
+
+    capacity: float = public_field(
+        default=1.0,
+        description="Maximum number of tokens the bucket can hold (burst size)",
+    )
+    rate: float = public_field(
+        default=1.0,
+        description="Token refill rate per second",
+    )
+    _blocked_until_ns: int = private_field(
+        default=0,
+        description="Monotonic deadline (nanoseconds) before which no token "
+        "is handed out, set by reserve() to honor server-requested back-off",
+    )
+    _last_refill_ns: int | None = private_field(
+        default=None,
+        description="Monotonic time (nanoseconds) of the last refill",
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock,
+        description="Serializes token accounting so concurrent callers "
+        "(e.g. a thread pool sharing one gateway) cannot double-spend",
+    )
+    _tokens: float = private_field(
+        default=0.0,
+        description="Currently available tokens",
+    )
+
+    def __attrs_post_init__(self) -> None:
+        self._tokens = self.capacity
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        delay = self._consume()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Take one token, awaiting until one is available."""
+        delay = self._consume()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def reserve(self, delay: float) -> None:
+        """Block token hand-out for `delay` seconds (e.g. Retry-After)."""
+        with self._lock:
+            self._blocked_until_ns = max(
+                self._blocked_until_ns, time.monotonic_ns() + int(delay * 1e9)
+            )
+
+    def _consume(self) -> float:
+        """Consume one token and return how long the caller must wait.
+
+        The clock is monotonic_ns with integer arithmetic: immune to
+        wall-clock jumps and cheaper than float time comparisons. The
+        accounting runs under a lock so concurrent callers cannot
+        double-spend a token; the wait itself happens outside the lock,
+        in acquire()/acquire_async().
+        """
+        with self._lock:
+            now_ns = time.monotonic_ns()
+            if self._last_refill_ns is not None:
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens
+                    + (now_ns - self._last_refill_ns) * self.rate / 1e9,
+                )
+            self._last_refill_ns = now_ns
+
+            wait_ns = 0
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+            else:
+                # The token is spent as soon as it accrues, so account for
+                # the refill happening during the wait.
+                wait_ns = int((1.0 - self._tokens) * 1e9 / self.rate)
+                self._tokens = 0.0
+                self._last_refill_ns = now_ns + wait_ns
+
+            if self._blocked_until_ns > now_ns + wait_ns:
+                wait_ns = self._blocked_until_ns - now_ns
+            return wait_ns / 1e9
@@ -22,5 +22,6 @@ class ContentType(Enum):
 
 
 class Header(Enum):
+    ACCEPT_ENCODING: str = "Accept-Encoding"
     CONTENT_TYPE: str = "Content-Type"
     AUTHORIZATION: str = "Authorization"
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+pytest.importorskip("aiohttp")
+
+
+class FakeAiohttpResponse:
+    def __init__(self, status: int = 200, body: bytes = b'{"id": 1}') -> None:
+        self.status = status
+        self.url = "https://api.example.com/items"
+        self.headers = {"Content-Type": "application/json"}
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self) -> FakeAiohttpResponse:
+        return self
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+
+class FakeAiohttpSession:
+    def __init__(self, response: FakeAiohttpResponse) -> None:
+        self.closed = False
+        self.response = response
+        self.request_kwargs = None
+
+    def request(self, **kwargs) -> FakeAiohttpResponse:
+        self.request_kwargs = kwargs
+        return self.response
+
+
+@pytest.fixture
+def gateway() -> AbstractGateway:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+    gateway = AbstractGateway(base_url="https://api.example.com", io=IoManager())
+    gateway.connected = True
+    return gateway
+
+
+def test_make_request_async_success(gateway) -> None:
+    session = FakeAiohttpSession(FakeAiohttpResponse())
+
+    with patch.object(type(gateway), "_get_async_session", return_value=session):
+        response = asyncio.run(
+            gateway.make_request_async(endpoint="/items", expected_status_codes=200)
+        )
+
+    assert response is not None
+    assert response.status_code == 200
+    assert response.json() == {"id": 1}
+    assert session.request_kwargs["method"] == "GET"
+    assert session.request_kwargs["url"] == "https://api.example.com/items"
+
+
+def test_make_request_async_unexpected_status_raises(gateway) -> None:
+    from wexample_helpers.error.gateway_error import GatewayError
+
+    session = FakeAiohttpSession(
+        FakeAiohttpResponse(status=404, body=b'{"message": "not found"}')
+    )
+
+    with patch.object(type(gateway), "_get_async_session", return_value=session):
+        with pytest.raises(GatewayError):
+            asyncio.run(
+                gateway.make_request_async(
+                    endpoint="/missing",
+                    expected_status_codes=200,
+                    raise_exceptions=True,
+                )
+            )
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from wexample_prompt.common.io_manager import IoManager
+
+from wexample_api.common.abstract_gateway import AbstractGateway, _accept_encoding
+
+
+def test_session_advertises_supported_encodings() -> None:
+    gateway = AbstractGateway(base_url="https://api.example.com", io=IoManager())
+
+    session = gateway._get_session()
+
+    assert session.headers["Accept-Encoding"] == _accept_encoding()
+
+
+def test_accept_encoding_only_lists_decodable_codings() -> None:
+    try:
+        import brotli  # noqa: F401
+
+        has_brotli = True
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+
+            has_brotli = True
+        except ImportError:
+            has_brotli = False
+
+    expected = "br, gzip, deflate" if has_brotli else "gzip, deflate"
+    assert _accept_encoding() == expected
+
+
+def test_explicit_default_header_keeps_precedence() -> None:
+    gateway = AbstractGateway(
+        base_url="https://api.example.com",
+        io=IoManager(),
+        default_headers={"Accept-Encoding": "identity"},
+    )
+
+    session = gateway._get_session()
+
+    assert session.headers["Accept-Encoding"] == "identity"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from wexample_api.common.endpoint import endpoint
+from wexample_api.enums.http import HttpMethod
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+
+def make_response(
+    content: bytes = b'{"id": 1}', status_code: int = 200
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+@pytest.fixture
+def gateway() -> AbstractGateway:
+    from wexample_helpers.decorator.base_class import base_class
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+    @base_class
+    class ItemGateway(AbstractGateway):
+        create_item = endpoint(HttpMethod.POST, "/items", 201)
+        get_item = endpoint(HttpMethod.GET, "/items/{item_id}")
+        list_items = endpoint(HttpMethod.GET, "/items")
+
+    gateway = ItemGateway(
+        base_url="https://api.example.com",
+        io=IoManager(),
+        rate_limit_delay=0,
+    )
+    gateway.connected = True
+    return gateway
+
+
+def test_generated_method_adopts_attribute_name(gateway) -> None:
+    method = type(gateway).get_item
+
+    assert method.__name__ == "get_item"
+    assert method.__qualname__.endswith("ItemGateway.get_item")
+
+
+@patch("requests.Session.request")
+def test_placeholder_filled_from_positional_argument(mock_request, gateway) -> None:
+    mock_request.return_value = make_response()
+
+    result = gateway.get_item(42)
+
+    assert result == {"id": 1}
+    assert mock_request.call_args.kwargs["url"] == "https://api.example.com/items/42"
+
+
+@patch("requests.Session.request")
+def test_placeholder_filled_from_keyword_argument(mock_request, gateway) -> None:
+    mock_request.return_value = make_response()
+
+    gateway.get_item(item_id=7)
+
+    assert mock_request.call_args.kwargs["url"] == "https://api.example.com/items/7"
+
+
+@patch("requests.Session.request")
+def test_get_kwargs_become_query_params(mock_request, gateway) -> None:
+    mock_request.return_value = make_response(b"[]")
+
+    gateway.list_items(_limit=3)
+
+    assert (
+        mock_request.call_args.kwargs["url"]
+        == "https://api.example.com/items?_limit=3"
+    )
+
+
+@patch("requests.Session.request")
+def test_post_kwargs_become_body(mock_request, gateway) -> None:
+    mock_request.return_value = make_response(status_code=201)
+
+    gateway.create_item(name="Test")
+
+    assert mock_request.call_args.kwargs["data"] == b'{"name":"Test"}'
+
+
+@patch("requests.Session.request")
+def test_unexpected_status_returns_none(mock_request, gateway) -> None:
+    mock_request.return_value = make_response(b"{}", status_code=404)
+
+    assert gateway.get_item(999) is None
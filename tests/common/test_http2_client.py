@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+httpx = pytest.importorskip("httpx")
+
+
+class FakeHttpxClient:
+    def __init__(self, response: httpx.Response) -> None:
+        self.response = response
+        self.request_kwargs = None
+
+    def request(self, **kwargs) -> httpx.Response:
+        self.request_kwargs = kwargs
+        return self.response
+
+
+@pytest.fixture
+def gateway() -> AbstractGateway:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+    gateway = AbstractGateway(
+        base_url="https://api.example.com",
+        io=IoManager(),
+        rate_limit_delay=0,
+        use_http2=True,
+    )
+    gateway.connected = True
+    return gateway
+
+
+def test_make_request_uses_httpx_client(gateway) -> None:
+    client = FakeHttpxClient(httpx.Response(200, json={"id": 1}))
+
+    with patch.object(type(gateway), "_get_httpx_client", return_value=client):
+        response = gateway.make_request(
+            endpoint="/items/1", expected_status_codes=200
+        )
+
+    assert response is not None
+    assert response.status_code == 200
+    assert response.json() == {"id": 1}
+    assert client.request_kwargs["method"] == "GET"
+    assert client.request_kwargs["url"] == "https://api.example.com/items/1"
+
+
+def test_json_body_sent_as_content_bytes(gateway) -> None:
+    from wexample_api.enums.http import HttpMethod
+
+    client = FakeHttpxClient(httpx.Response(201, json={"id": 1}))
+
+    with patch.object(type(gateway), "_get_httpx_client", return_value=client):
+        gateway.make_request(
+            endpoint="/items",
+            method=HttpMethod.POST,
+            data={"name": "Test"},
+            expected_status_codes=201,
+        )
+
+    assert client.request_kwargs["content"] == b'{"name":"Test"}'
+    assert client.request_kwargs["headers"]["Content-Type"] == "application/json"
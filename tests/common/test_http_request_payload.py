@@ -74,6 +74,25 @@ class TestHttpRequestPayload(unittest.TestCase):
         self.assertEqual(payload.query_params, query_params)
         self.assertEqual(payload.headers, headers)
 
+    def test_from_endpoint_normalizes_expected_status_codes(self) -> None:
+        """Test that expected status codes are normalized to a frozenset."""
+        from wexample_api.common.http_request_payload import HttpRequestPayload
+
+        base_url = "https://api.example.com"
+
+        payload = HttpRequestPayload.from_endpoint(
+            base_url, "/users", expected_status_codes=201
+        )
+        self.assertEqual(payload.expected_status_codes, frozenset({201}))
+
+        payload = HttpRequestPayload.from_endpoint(
+            base_url, "/users", expected_status_codes=[200, 204]
+        )
+        self.assertEqual(payload.expected_status_codes, frozenset({200, 204}))
+
+        payload = HttpRequestPayload.from_endpoint(base_url, "/users")
+        self.assertIsNone(payload.expected_status_codes)
+
     def test_from_endpoint_with_trailing_slash(self) -> None:
         """Test creating HttpRequestPayload with trailing slash in base_url."""
         from wexample_api.common.http_request_payload import HttpRequestPayload
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+
+@pytest.fixture
+def gateway() -> AbstractGateway:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+    return AbstractGateway(base_url="https://api.example.com", io=IoManager())
+
+
+def test_concurrent_first_calls_share_one_bucket(gateway) -> None:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        buckets = list(
+            executor.map(lambda _: gateway._get_rate_limit_bucket(), range(8))
+        )
+
+    assert all(bucket is buckets[0] for bucket in buckets)
+
+
+def test_concurrent_first_calls_share_one_session(gateway) -> None:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(executor.map(lambda _: gateway._get_session(), range(8)))
+
+    assert all(session is sessions[0] for session in sessions)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+import requests
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+
+def make_batch_response(boundary: str = "batch_abc") -> requests.Response:
+    body = (
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        "\r\n"
+        "HTTP/1.1 200 OK\r\n"
+        "Content-Type: application/json\r\n"
+        "\r\n"
+        '{"id": 1}\r\n'
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        "\r\n"
+        "HTTP/1.1 404 Not Found\r\n"
+        "\r\n"
+        '{"message": "not found"}\r\n'
+        f"--{boundary}--\r\n"
+    )
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body.encode("utf-8")
+    response.headers["Content-Type"] = f"multipart/mixed; boundary={boundary}"
+    return response
+
+
+@pytest.fixture
+def gateway() -> AbstractGateway:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+    gateway = AbstractGateway(
+        base_url="https://api.example.com",
+        io=IoManager(),
+        rate_limit_delay=0,
+    )
+    gateway.connected = True
+    return gateway
+
+
+def test_to_batch_part_serializes_method_target_and_body() -> None:
+    from wexample_api.common.http_request_payload import HttpRequestPayload
+    from wexample_api.enums.http import HttpMethod
+
+    payload = HttpRequestPayload.from_endpoint(
+        base_url="https://api.example.com",
+        endpoint="/items",
+        method=HttpMethod.POST,
+        data={"name": "Test"},
+        query_params={"lang": "en"},
+    )
+
+    part = payload.to_batch_part()
+    lines = part.split("\r\n")
+
+    assert lines[0] == "POST /items?lang=en HTTP/1.1"
+    assert "Content-Type: application/json" in lines
+    assert lines[-1] == '{"name":"Test"}'
+
+
+@patch("requests.Session.request")
+def test_make_requests_batch_parses_each_part(mock_request, gateway) -> None:
+    from wexample_api.common.http_request_payload import HttpRequestPayload
+
+    mock_request.return_value = make_batch_response()
+    payloads = [
+        HttpRequestPayload.from_endpoint("https://api.example.com", "/items/1"),
+        HttpRequestPayload.from_endpoint("https://api.example.com", "/items/2"),
+    ]
+
+    responses = gateway.make_requests_batch(payloads)
+
+    assert mock_request.call_count == 1
+    assert [r.status_code for r in responses] == [200, 404]
+    assert responses[0].json() == {"id": 1}
+    assert responses[1].json() == {"message": "not found"}
+
+    request_kwargs = mock_request.call_args.kwargs
+    assert request_kwargs["url"] == "https://api.example.com/$batch"
+    assert request_kwargs["headers"]["Content-Type"].startswith("multipart/mixed")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+import requests
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+
+def make_response(content: bytes = b"[]") -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+@pytest.fixture
+def gateway() -> AbstractGateway:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+    gateway = AbstractGateway(
+        base_url="https://api.example.com",
+        io=IoManager(),
+        rate_limit_delay=0,
+    )
+    gateway.connected = True
+    return gateway
+
+
+@patch("requests.Session.request")
+def test_scalar_query_params_baked_into_url(mock_request, gateway) -> None:
+    mock_request.return_value = make_response()
+
+    gateway.make_request(
+        endpoint="/posts",
+        query_params={"_limit": 3, "lang": "en"},
+        expected_status_codes=200,
+    )
+
+    request_kwargs = mock_request.call_args.kwargs
+    assert request_kwargs["url"] == "https://api.example.com/posts?_limit=3&lang=en"
+    assert request_kwargs["params"] is None
+
+
+@patch("requests.Session.request")
+def test_non_scalar_query_params_left_to_backend(mock_request, gateway) -> None:
+    mock_request.return_value = make_response()
+
+    gateway.make_request(
+        endpoint="/posts",
+        query_params={"ids": [1, 2]},
+        expected_status_codes=200,
+    )
+
+    request_kwargs = mock_request.call_args.kwargs
+    assert request_kwargs["url"] == "https://api.example.com/posts"
+    assert request_kwargs["params"] == {"ids": [1, 2]}
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+import requests
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+
+def make_response(
+    status_code: int = 200,
+    content: bytes = b'{"id": 1}',
+    headers: dict[str, str] | None = None,
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def gateway() -> AbstractGateway:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+    gateway = AbstractGateway(
+        base_url="https://api.example.com",
+        io=IoManager(),
+        cache_enabled=True,
+        rate_limit_delay=0,
+    )
+    gateway.connected = True
+    return gateway
+
+
+@patch("requests.Session.request")
+def test_fresh_entry_served_without_network(mock_request, gateway) -> None:
+    mock_request.return_value = make_response(
+        headers={"Cache-Control": "max-age=60"}
+    )
+
+    first = gateway.make_request(endpoint="/items/1", expected_status_codes=200)
+    second = gateway.make_request(endpoint="/items/1", expected_status_codes=200)
+
+    assert mock_request.call_count == 1
+    assert first.content == second.content
+    assert second.status_code == 200
+
+
+@patch("requests.Session.request")
+def test_stale_entry_revalidated_with_etag(mock_request, gateway) -> None:
+    mock_request.side_effect = [
+        make_response(headers={"ETag": '"abc"'}),
+        make_response(status_code=304, content=b""),
+    ]
+
+    first = gateway.make_request(endpoint="/items/1", expected_status_codes=200)
+    second = gateway.make_request(endpoint="/items/1", expected_status_codes=200)
+
+    assert mock_request.call_count == 2
+    revalidation_headers = mock_request.call_args.kwargs["headers"]
+    assert revalidation_headers["If-None-Match"] == '"abc"'
+    assert second.status_code == 200
+    assert second.content == first.content
+
+
+@patch("requests.Session.request")
+def test_cache_disabled_always_fetches(mock_request, gateway) -> None:
+    gateway.cache_enabled = False
+    mock_request.return_value = make_response(
+        headers={"Cache-Control": "max-age=60"}
+    )
+
+    gateway.make_request(endpoint="/items/1", expected_status_codes=200)
+    gateway.make_request(endpoint="/items/1", expected_status_codes=200)
+
+    assert mock_request.call_count == 2
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+
+def make_response(content: bytes, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+@pytest.fixture
+def gateway() -> AbstractGateway:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+    return AbstractGateway(base_url="https://api.example.com", io=IoManager())
+
+
+def test_format_response_content_parses_small_json(gateway) -> None:
+    response = make_response(b'{"message": "ok"}')
+
+    assert gateway.format_response_content(response) == {"message": "ok"}
+
+
+def test_format_response_content_truncates_large_body(gateway) -> None:
+    gateway.response_preview_limit = 16
+    response = make_response(b"x" * 1000)
+
+    preview = gateway.format_response_content(response)
+
+    assert preview == "x" * 16
+
+
+def test_extract_error_message_uses_bounded_buffer(gateway) -> None:
+    gateway.response_preview_limit = 8
+    response = make_response(b"a long plain-text error body", status_code=500)
+
+    assert gateway._extract_error_message(response) == "a long p"
+
+
+def test_preview_leaves_live_stream_untouched(gateway) -> None:
+    response = requests.Response()
+    response.status_code = 500
+    response.raw = io.BytesIO(b'{"error": "boom"}')
+
+    assert gateway.format_response_content(response) == "<streamed body not read>"
+    assert gateway._extract_error_message(response) == "HTTP 500"
+    # The caller still reads the full body afterwards.
+    assert response.content == b'{"error": "boom"}'
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+import requests
+from wexample_helpers.error.gateway_error import GatewayError
+
+if TYPE_CHECKING:
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+pytest.importorskip("ijson")
+
+
+class FakeRaw(io.BytesIO):
+    """BytesIO subclass accepting the decode_content attribute."""
+
+
+def make_streaming_response(
+    content: bytes, status_code: int = 200
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = FakeRaw(content)
+    return response
+
+
+@pytest.fixture
+def gateway() -> AbstractGateway:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+    gateway = AbstractGateway(
+        base_url="https://api.example.com",
+        io=IoManager(),
+        rate_limit_delay=0,
+    )
+    gateway.connected = True
+    return gateway
+
+
+@patch("requests.Session.request")
+def test_items_yielded_incrementally(mock_request, gateway) -> None:
+    mock_request.return_value = make_streaming_response(
+        b'[{"id": 1}, {"id": 2}, {"id": 3}]'
+    )
+
+    items = gateway.stream_json("/posts")
+
+    assert next(items) == {"id": 1}
+    assert list(items) == [{"id": 2}, {"id": 3}]
+    assert mock_request.call_args.kwargs["stream"] is True
+
+
+@patch("requests.Session.request")
+def test_nested_path_selects_items(mock_request, gateway) -> None:
+    mock_request.return_value = make_streaming_response(
+        b'{"results": [{"id": 1}, {"id": 2}]}'
+    )
+
+    items = list(gateway.stream_json("/posts", path="results.item"))
+
+    assert items == [{"id": 1}, {"id": 2}]
+
+
+@patch("requests.Session.request")
+def test_unexpected_status_raises_gateway_error(mock_request, gateway) -> None:
+    response = make_streaming_response(b'{"error": "not found"}', status_code=404)
+    response._content = b'{"error": "not found"}'
+    mock_request.return_value = response
+
+    with pytest.raises(GatewayError):
+        list(gateway.stream_json("/posts/999999"))
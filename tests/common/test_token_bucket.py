@@ -0,0 +1,50 @@
+"""Tests for TokenBucket rate limiter."""
+
+from __future__ import annotations
+
+import unittest
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket class."""
+
+    def test_burst_within_capacity_is_free(self) -> None:
+        """A burst up to capacity should not require any waiting."""
+        from wexample_api.common.token_bucket import TokenBucket
+
+        bucket = TokenBucket(rate=10.0, capacity=2.0)
+
+        self.assertEqual(bucket._consume(), 0.0)
+        self.assertEqual(bucket._consume(), 0.0)
+        self.assertGreater(bucket._consume(), 0.0)
+
+    def test_empty_bucket_waits_for_refill(self) -> None:
+        """Once empty, the wait should approximate one token's refill time."""
+        from wexample_api.common.token_bucket import TokenBucket
+
+        bucket = TokenBucket(rate=10.0, capacity=1.0)
+
+        self.assertEqual(bucket._consume(), 0.0)
+        self.assertAlmostEqual(bucket._consume(), 0.1, places=2)
+
+    def test_concurrent_consumers_cannot_double_spend(self) -> None:
+        """Parallel callers should get exactly `capacity` free tokens."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wexample_api.common.token_bucket import TokenBucket
+
+        bucket = TokenBucket(rate=0.001, capacity=4.0)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            waits = list(executor.map(lambda _: bucket._consume(), range(8)))
+
+        self.assertEqual(sum(1 for wait in waits if wait == 0.0), 4)
+
+    def test_reserve_blocks_future_acquires(self) -> None:
+        """A server-requested back-off should delay the next token."""
+        from wexample_api.common.token_bucket import TokenBucket
+
+        bucket = TokenBucket(rate=100.0, capacity=1.0)
+        bucket.reserve(0.5)
+
+        self.assertGreaterEqual(bucket._consume(), 0.4)
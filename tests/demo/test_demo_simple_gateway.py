@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import orjson
 import pytest
 
 if TYPE_CHECKING:
@@ -42,7 +43,7 @@ def test_check_connection(gateway) -> None:
     assert gateway.check_connection() is True
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_create_item(mock_request, gateway) -> None:
     # Arrange
     item_data = {"name": "Test Item"}
@@ -58,15 +59,15 @@ def test_create_item(mock_request, gateway) -> None:
     mock_request.assert_called_once_with(
         method="POST",
         url="https://api.example.com/items",
-        json=item_data,
+        data=orjson.dumps(item_data),
         params=None,
-        headers={},
+        headers={"Content-Type": "application/json"},
         timeout=30,
         stream=False,
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_delete_item(mock_request, gateway) -> None:
     # Arrange
     item_id = "123"
@@ -80,15 +81,14 @@ def test_delete_item(mock_request, gateway) -> None:
     mock_request.assert_called_once_with(
         method="DELETE",
         url=f"https://api.example.com/items/{item_id}",
-        json=None,
         params=None,
-        headers={},
+        headers=None,
         timeout=30,
         stream=False,
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_get_user_info(mock_request, gateway) -> None:
     # Arrange
     expected_data = {"id": 1, "name": "Test User"}
@@ -103,9 +103,8 @@ def test_get_user_info(mock_request, gateway) -> None:
     mock_request.assert_called_once_with(
         method="GET",
         url="https://api.example.com/user",
-        json=None,
         params=None,
-        headers={},
+        headers=None,
         timeout=30,
         stream=False,
     )
@@ -120,7 +119,7 @@ def test_not_connected_error(gateway) -> None:
         gateway.get_user_info()
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_update_item(mock_request, gateway) -> None:
     # Arrange
     item_id = "123"
@@ -137,9 +136,9 @@ def test_update_item(mock_request, gateway) -> None:
     mock_request.assert_called_once_with(
         method="PUT",
         url=f"https://api.example.com/items/{item_id}",
-        json=item_data,
+        data=orjson.dumps(item_data),
         params=None,
-        headers={},
+        headers={"Content-Type": "application/json"},
         timeout=30,
         stream=False,
     )